@@ -1,6 +1,7 @@
 """gcal-sdk: A clean, typed Python SDK for the Google Calendar API v3."""
 
 from .auth import load_credentials
+from .batch import Batch, BatchResult
 from .client import GCalClient
 from .models import (
     Attendee,
@@ -17,6 +18,8 @@ __version__ = "0.1.0"
 __all__ = [
     "GCalClient",
     "load_credentials",
+    "Batch",
+    "BatchResult",
     "Event",
     "EventDateTime",
     "Attendee",
@@ -0,0 +1,112 @@
+"""Internal async HTTP transport for the Google Calendar API.
+
+Requires the optional ``httpx`` dependency (``pip install gcal-sdk-ldraney[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import quote
+
+from . import _json
+from ._http import GZIP_USER_AGENT, import_httpx
+from .auth import _refresh_request
+
+if TYPE_CHECKING:
+    import httpx
+    from google.oauth2.credentials import Credentials
+
+BASE_URL = "https://www.googleapis.com/calendar/v3"
+
+
+def quote_id(value: str) -> str:
+    """Quote a calendar or event ID for use as a URL path segment."""
+    return quote(value, safe="")
+
+
+class AsyncTransport:
+    """Sends authorized JSON requests to the Calendar API over httpx.
+
+    The OAuth access token is sent as a bearer token and refreshed once
+    if the API answers 401. At most *max_concurrency* requests are in
+    flight at a time.
+    """
+
+    def __init__(self, credentials: Credentials, *, max_concurrency: int = 20) -> None:
+        httpx = import_httpx()
+        self._credentials = credentials
+        self._client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            headers={"User-Agent": GZIP_USER_AGENT},
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def _refresh(self, stale_token: Optional[str]) -> None:
+        """Refresh the access token, unless another request already has.
+
+        *stale_token* is the token the caller found invalid or was
+        rejected with; concurrent callers wait on one refresh.
+        """
+        async with self._refresh_lock:
+            if self._credentials.token != stale_token and self._credentials.valid:
+                return
+            # google-auth refreshes synchronously; keep it off the event loop
+            await asyncio.to_thread(self._credentials.refresh, _refresh_request())
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict] = None,
+        json: Optional[Any] = None,
+    ) -> Any:
+        """Send a request and return the decoded JSON response body.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status.
+        """
+        if not self._credentials.valid:
+            await self._refresh(self._credentials.token)
+
+        token = self._credentials.token
+        response = await self._send(method, path, params=params, json=json)
+        if response.status_code == 401:
+            await self._refresh(token)
+            response = await self._send(method, path, params=params, json=json)
+
+        response.raise_for_status()
+        if not response.content:
+            return None
+        return _json.loads(response.content)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict],
+        json: Optional[Any],
+    ) -> httpx.Response:
+        headers = {"Authorization": f"Bearer {self._credentials.token}"}
+        content = None
+        if json is not None:
+            content = _json.dumps(json)
+            headers["Content-Type"] = "application/json"
+        async with self._semaphore:
+            return await self._client.request(
+                method, path, params=params, content=content, headers=headers
+            )
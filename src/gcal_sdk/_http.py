@@ -0,0 +1,132 @@
+"""Internal helpers for executing googleapiclient requests."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+import httplib2
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+from googleapiclient.model import JsonModel
+
+from . import _json
+
+if TYPE_CHECKING:
+    import httpx
+    from googleapiclient.http import HttpRequest
+
+T = TypeVar("T")
+
+#: Google APIs only gzip a response when the request's User-Agent contains
+#: "gzip" (googleapiclient's JsonModel appends "(gzip)" for the same reason).
+GZIP_USER_AGENT = "gcal-sdk-ldraney (gzip)"
+
+#: Signature shared by all request executors: take a prepared request and a
+#: parser for its response body, return the parsed result (or a placeholder).
+Executor = Callable[["HttpRequest", Callable[[Any], T]], Any]
+
+
+def execute_now(request: HttpRequest, parse: Callable[[Any], T]) -> T:
+    """Execute a request immediately and parse its response body."""
+    return parse(request.execute())
+
+
+def ignore_response(_: Any) -> None:
+    """Parser for endpoints with an empty response body (e.g. delete)."""
+    return None
+
+
+class FastJsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson when available.
+
+    Response bodies are parsed straight from bytes, without decoding them
+    to ``str`` first. Request bodies keep JsonModel's ASCII-only
+    ``json.dumps``: googleapiclient sends the ``str`` as-is and sets
+    Content-Length to its length in characters, which only matches the
+    byte count when every character is ASCII.
+    """
+
+    def deserialize(self, content: Any) -> Any:
+        try:
+            body = _json.loads(content)
+        except json.JSONDecodeError:
+            # Same fallback as JsonModel: hand back non-JSON bodies as text
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            return content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+def import_httpx():  # noqa: ANN201
+    """Import httpx, with a helpful error if the extra isn't installed."""
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            "This feature requires httpx. "
+            "Install it with: pip install 'gcal-sdk-ldraney[async]'"
+        ) from exc
+    return httpx
+
+
+@lru_cache(maxsize=1)
+def shared_http2_client() -> httpx.Client:
+    """Return the process-wide HTTP/2 client used by :class:`Http2Adapter`."""
+    httpx = import_httpx()
+    return httpx.Client(
+        http2=True,
+        timeout=DEFAULT_HTTP_TIMEOUT_SEC,
+        limits=httpx.Limits(max_connections=10),
+    )
+
+
+class Http2Adapter:
+    """Minimal ``httplib2.Http`` stand-in that sends requests over httpx.
+
+    googleapiclient (through google-auth-httplib2) only needs
+    ``request()`` returning an ``(httplib2.Response, bytes)`` pair. Unlike
+    httplib2, the shared httpx client is thread-safe, so concurrent calls
+    from many threads multiplex over one HTTP/2 connection.
+    """
+
+    def __init__(self, client: Optional[httpx.Client] = None) -> None:
+        self._client = client if client is not None else shared_http2_client()
+        self.timeout = DEFAULT_HTTP_TIMEOUT_SEC
+        self.redirect_codes: set[int] = set()
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Any = None,
+        headers: Optional[dict] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+        **kwargs: Any,
+    ) -> tuple[httplib2.Response, bytes]:
+        """Send a request, returning it in httplib2's format.
+
+        Redirects are followed (up to the httpx client's own limit) unless
+        *redirections* is 0, as with httplib2.
+        """
+        response = self._client.request(
+            method,
+            uri,
+            content=body,
+            headers=headers,
+            follow_redirects=redirections > 0,
+        )
+        info = {
+            key: value
+            for key, value in response.headers.items()
+            # httpx has already decompressed the body
+            if key != "content-encoding"
+        }
+        info["status"] = str(response.status_code)
+        return httplib2.Response(info), response.content
+
+    def close(self) -> None:
+        """No-op: the shared client outlives any single Resource."""
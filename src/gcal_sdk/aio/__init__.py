@@ -0,0 +1,13 @@
+"""Async (asyncio) interface for gcal-sdk. Requires the ``async`` extra."""
+
+from .calendars import AsyncCalendarsResource
+from .client import AsyncGCalClient
+from .events import AsyncEventsResource
+from .freebusy import AsyncFreeBusyResource
+
+__all__ = [
+    "AsyncGCalClient",
+    "AsyncEventsResource",
+    "AsyncCalendarsResource",
+    "AsyncFreeBusyResource",
+]
@@ -0,0 +1,129 @@
+"""Async Calendars resource wrapper for Google Calendar API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from .._async_http import quote_id
+from ..calendars import (
+    _CALENDAR_FIELDS,
+    CalendarsResource,
+    _build_calendar_body,
+    _parse_calendar_items,
+)
+from ..models import Calendar
+
+if TYPE_CHECKING:
+    from .._async_http import AsyncTransport
+
+_CALENDAR_LIST_PATH = "/users/me/calendarList"
+
+
+class AsyncCalendarsResource:
+    """Provides async methods for Google Calendar CalendarList operations."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self._transport = transport
+
+    async def list(
+        self,
+        *,
+        show_deleted: bool = False,
+        show_hidden: bool = False,
+        max_results: int = 250,
+        page_token: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> list[Calendar]:
+        """List calendars in the user's calendar list.
+
+        See :meth:`CalendarsResource.list`.
+        """
+        params = CalendarsResource._build_list_kwargs(
+            show_deleted=show_deleted,
+            show_hidden=show_hidden,
+            max_results=max_results,
+            page_token=page_token,
+            fields=fields,
+        )
+
+        result = await self._transport.request(
+            "GET", _CALENDAR_LIST_PATH, params=params
+        )
+        return _parse_calendar_items(result)
+
+    async def list_all(
+        self,
+        *,
+        show_deleted: bool = False,
+        show_hidden: bool = False,
+        fields: Optional[str] = None,
+    ) -> list[Calendar]:
+        """List all calendars, automatically paginating.
+
+        A custom *fields* selector must include nextPageToken.
+
+        Returns:
+            Complete list of Calendar objects across all pages.
+        """
+        all_calendars: list[Calendar] = []
+        params = CalendarsResource._build_list_kwargs(
+            show_deleted=show_deleted,
+            show_hidden=show_hidden,
+            fields=fields,
+        )
+
+        while True:
+            result = await self._transport.request(
+                "GET", _CALENDAR_LIST_PATH, params=params
+            )
+            all_calendars.extend(_parse_calendar_items(result))
+
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+            params["pageToken"] = page_token
+
+        return all_calendars
+
+    async def get(
+        self,
+        calendar_id: str = "primary",
+        *,
+        fields: Optional[str] = None,
+    ) -> Calendar:
+        """Get a calendar by ID. See :meth:`CalendarsResource.get`."""
+        result = await self._transport.request(
+            "GET",
+            f"{_CALENDAR_LIST_PATH}/{quote_id(calendar_id)}",
+            params={"fields": fields if fields is not None else _CALENDAR_FIELDS},
+        )
+        return Calendar.from_api_response(result)
+
+    async def create(
+        self,
+        summary: str,
+        *,
+        description: Optional[str] = None,
+        time_zone: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> Calendar:
+        """Create a new secondary calendar. See :meth:`CalendarsResource.create`."""
+        body = _build_calendar_body(
+            summary,
+            description=description,
+            time_zone=time_zone,
+            location=location,
+        )
+
+        result = await self._transport.request("POST", "/calendars", json=body)
+        return Calendar.from_api_response(result)
+
+    async def delete(self, calendar_id: str) -> None:
+        """Delete a secondary calendar. See :meth:`CalendarsResource.delete`."""
+        await self._transport.request("DELETE", f"/calendars/{quote_id(calendar_id)}")
+
+    async def clear(self, calendar_id: str = "primary") -> None:
+        """Clear all events from a calendar. See :meth:`CalendarsResource.clear`."""
+        await self._transport.request(
+            "POST", f"/calendars/{quote_id(calendar_id)}/clear"
+        )
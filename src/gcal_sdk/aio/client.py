@@ -0,0 +1,80 @@
+"""AsyncGCalClient — the asyncio interface for the SDK."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from google.oauth2.credentials import Credentials
+
+from .._async_http import AsyncTransport
+from ..auth import DEFAULT_CREDENTIALS_PATH, DEFAULT_TOKEN_PATH, load_credentials
+from .calendars import AsyncCalendarsResource
+from .events import AsyncEventsResource
+from .freebusy import AsyncFreeBusyResource
+
+
+class AsyncGCalClient:
+    """An asyncio client for the Google Calendar API v3.
+
+    Requires the ``async`` extra (httpx). Every network method is a
+    coroutine, so independent calls can run concurrently::
+
+        from gcal_sdk.aio import AsyncGCalClient
+
+        async with AsyncGCalClient() as client:
+            primary, work = await asyncio.gather(
+                client.events.list("primary"),
+                client.events.list(work_calendar_id),
+            )
+
+    All resources share one HTTP/2 connection pool. At most
+    *max_concurrency* requests are in flight at once.
+
+    Credentials are loaded the same way as for :class:`~gcal_sdk.GCalClient`.
+    """
+
+    def __init__(
+        self,
+        *,
+        credentials: Optional[Credentials] = None,
+        credentials_path: str | Path = DEFAULT_CREDENTIALS_PATH,
+        token_path: str | Path = DEFAULT_TOKEN_PATH,
+        max_concurrency: int = 20,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            credentials: Pre-built Google OAuth credentials. If provided,
+                credentials_path and token_path are ignored.
+            credentials_path: Path to the OAuth client credentials JSON file.
+            token_path: Path to the stored token JSON file.
+            max_concurrency: Maximum number of requests in flight at once.
+        """
+        if credentials is None:
+            credentials = load_credentials(
+                credentials_path=credentials_path,
+                token_path=token_path,
+            )
+
+        self._credentials = credentials
+        self._transport = AsyncTransport(credentials, max_concurrency=max_concurrency)
+
+        self.events = AsyncEventsResource(self._transport)
+        self.calendars = AsyncCalendarsResource(self._transport)
+        self.freebusy = AsyncFreeBusyResource(self._transport)
+
+    async def __aenter__(self) -> "AsyncGCalClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._transport.aclose()
+
+    @property
+    def credentials(self) -> Credentials:
+        """Access the underlying OAuth credentials."""
+        return self._credentials
@@ -0,0 +1,325 @@
+"""Async Events resource wrapper for Google Calendar API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from .._async_http import quote_id
+from ..events import (
+    _EVENT_FIELDS,
+    _EVENT_LIST_FIELDS,
+    EventsResource,
+    _build_event_body,
+    _ensure_isoformat,
+    _parse_event_items,
+)
+from ..models import Event, EventDateTime
+
+if TYPE_CHECKING:
+    from .._async_http import AsyncTransport
+
+
+class AsyncEventsResource:
+    """Provides async methods for Google Calendar Events operations."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self._transport = transport
+
+    async def list(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 250,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        page_token: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+    ) -> list[Event]:
+        """List events from a calendar. See :meth:`EventsResource.list`."""
+        params = EventsResource._build_list_kwargs(
+            calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results,
+            single_events=single_events,
+            order_by=order_by,
+            q=q,
+            page_token=page_token,
+            show_deleted=show_deleted,
+            fields=fields,
+        )
+        del params["calendarId"]
+
+        result = await self._transport.request(
+            "GET", _events_path(calendar_id), params=params
+        )
+        return _parse_event_items(result)
+
+    async def list_all(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+        max_workers: int = 10,
+    ) -> list[Event]:
+        """List all events, fetching pages concurrently.
+
+        When both *time_min* and *time_max* are given, the range is split
+        into *max_workers* equal sub-ranges that are paginated in parallel;
+        events spanning a boundary are returned once. Within each
+        sub-range, the next page is requested before the current one is
+        parsed.
+
+        Same arguments as :meth:`EventsResource.list_all`, plus:
+
+        Args:
+            max_workers: Number of sub-ranges to fetch concurrently.
+
+        Returns:
+            Complete list of Event objects across all pages.
+        """
+        params = EventsResource._build_list_kwargs(
+            calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            single_events=single_events,
+            order_by=order_by,
+            q=q,
+            show_deleted=show_deleted,
+            fields=fields,
+        )
+        del params["calendarId"]
+        path = _events_path(calendar_id)
+
+        # Concatenating sub-ranges keeps start-time order but not "updated" order
+        split = (
+            time_min is not None
+            and time_max is not None
+            and max_workers > 1
+            and order_by in (None, "startTime")
+        )
+        if not split:
+            return await self._fetch_pages(path, params)
+
+        step = (time_max - time_min) / max_workers
+        bounds = [time_min + step * i for i in range(max_workers)] + [time_max]
+        ranges = await asyncio.gather(
+            *(
+                self._fetch_pages(
+                    path,
+                    {
+                        **params,
+                        "timeMin": _ensure_isoformat(lo),
+                        "timeMax": _ensure_isoformat(hi),
+                    },
+                )
+                for lo, hi in zip(bounds, bounds[1:])
+            )
+        )
+
+        seen: set[Optional[str]] = set()
+        all_events: list[Event] = []
+        for events in ranges:
+            for event in events:
+                if event.id not in seen:
+                    seen.add(event.id)
+                    all_events.append(event)
+        return all_events
+
+    async def _fetch_pages(self, path: str, params: dict) -> list[Event]:
+        """Fetch every page of an events list, overlapping requests with parsing."""
+        all_events: list[Event] = []
+        result = await self._transport.request("GET", path, params=params)
+
+        while True:
+            page_token = result.get("nextPageToken")
+            next_page = None
+            try:
+                if page_token:
+                    next_page = asyncio.ensure_future(
+                        self._transport.request(
+                            "GET", path, params={**params, "pageToken": page_token}
+                        )
+                    )
+                    # Let the next request get on the wire before parsing this page
+                    await asyncio.sleep(0)
+
+                all_events.extend(_parse_event_items(result))
+
+                if next_page is None:
+                    break
+                result = await next_page
+            finally:
+                # Don't leave the prefetch running if parsing failed or we
+                # were cancelled
+                if next_page is not None and not next_page.done():
+                    next_page.cancel()
+
+        return all_events
+
+    async def get(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        fields: Optional[str] = None,
+    ) -> Event:
+        """Get a single event by ID. See :meth:`EventsResource.get`."""
+        result = await self._transport.request(
+            "GET",
+            _event_path(calendar_id, event_id),
+            params={"fields": fields if fields is not None else _EVENT_FIELDS},
+        )
+        return Event.from_api_response(result)
+
+    async def create(
+        self,
+        calendar_id: str = "primary",
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        start: Optional[datetime | EventDateTime] = None,
+        end: Optional[datetime | EventDateTime] = None,
+        attendees: Optional[list[str | dict]] = None,
+        recurrence: Optional[list[str]] = None,
+        time_zone: Optional[str] = None,
+        body: Optional[dict] = None,
+    ) -> Event:
+        """Create an event on a calendar. See :meth:`EventsResource.create`."""
+        body = _build_event_body(
+            summary=summary,
+            description=description,
+            location=location,
+            start=start,
+            end=end,
+            time_zone=time_zone,
+            attendees=attendees,
+            recurrence=recurrence,
+            body=body,
+        )
+
+        result = await self._transport.request(
+            "POST", _events_path(calendar_id), json=body
+        )
+        return Event.from_api_response(result)
+
+    async def update(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        body: dict,
+    ) -> Event:
+        """Full update (PUT) of an event. See :meth:`EventsResource.update`."""
+        result = await self._transport.request(
+            "PUT", _event_path(calendar_id, event_id), json=body
+        )
+        return Event.from_api_response(result)
+
+    async def patch(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        start: Optional[datetime | EventDateTime] = None,
+        end: Optional[datetime | EventDateTime] = None,
+        attendees: Optional[list[str | dict]] = None,
+        recurrence: Optional[list[str]] = None,
+        time_zone: Optional[str] = None,
+        body: Optional[dict] = None,
+    ) -> Event:
+        """Partial update (PATCH) of an event. See :meth:`EventsResource.patch`."""
+        body = _build_event_body(
+            summary=summary,
+            description=description,
+            location=location,
+            start=start,
+            end=end,
+            time_zone=time_zone,
+            attendees=attendees,
+            recurrence=recurrence,
+            body=body,
+        )
+
+        result = await self._transport.request(
+            "PATCH", _event_path(calendar_id, event_id), json=body
+        )
+        return Event.from_api_response(result)
+
+    async def delete(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        send_updates: Optional[str] = None,
+    ) -> None:
+        """Delete an event. See :meth:`EventsResource.delete`."""
+        params: dict = {}
+        if send_updates is not None:
+            params["sendUpdates"] = send_updates
+        await self._transport.request(
+            "DELETE", _event_path(calendar_id, event_id), params=params
+        )
+
+    async def move(
+        self,
+        calendar_id: str,
+        event_id: str,
+        destination_calendar_id: str,
+    ) -> Event:
+        """Move an event to another calendar. See :meth:`EventsResource.move`."""
+        result = await self._transport.request(
+            "POST",
+            f"{_event_path(calendar_id, event_id)}/move",
+            params={"destination": destination_calendar_id},
+        )
+        return Event.from_api_response(result)
+
+    async def instances(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 250,
+        fields: Optional[str] = None,
+    ) -> list[Event]:
+        """List instances of a recurring event. See :meth:`EventsResource.instances`."""
+        params: dict = {
+            "maxResults": max_results,
+            "fields": fields if fields is not None else _EVENT_LIST_FIELDS,
+        }
+        if time_min is not None:
+            params["timeMin"] = _ensure_isoformat(time_min)
+        if time_max is not None:
+            params["timeMax"] = _ensure_isoformat(time_max)
+
+        result = await self._transport.request(
+            "GET", f"{_event_path(calendar_id, event_id)}/instances", params=params
+        )
+        return _parse_event_items(result)
+
+
+def _events_path(calendar_id: str) -> str:
+    return f"/calendars/{quote_id(calendar_id)}/events"
+
+
+def _event_path(calendar_id: str, event_id: str) -> str:
+    return f"{_events_path(calendar_id)}/{quote_id(event_id)}"
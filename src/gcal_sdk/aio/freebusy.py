@@ -0,0 +1,64 @@
+"""Async FreeBusy resource wrapper for Google Calendar API."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from ..freebusy import _build_query_body, _merge_query_results
+from ..models import FreeBusyResponse
+
+if TYPE_CHECKING:
+    from .._async_http import AsyncTransport
+
+
+class AsyncFreeBusyResource:
+    """Provides async methods for Google Calendar FreeBusy operations."""
+
+    def __init__(self, transport: AsyncTransport) -> None:
+        self._transport = transport
+
+    async def query(
+        self,
+        calendar_ids: list[str],
+        time_min: datetime,
+        time_max: datetime,
+        *,
+        time_zone: Optional[str] = None,
+        group_expansion_max: Optional[int] = None,
+        calendar_expansion_max: Optional[int] = None,
+        max_calendars_per_request: int = 50,
+    ) -> FreeBusyResponse:
+        """Query free/busy information for a set of calendars.
+
+        See :meth:`FreeBusyResource.query`. Longer *calendar_ids* lists
+        are split into shards of *max_calendars_per_request* that are
+        queried concurrently (within the transport's concurrency limit)
+        and merged into a single response.
+        """
+        shards = [
+            calendar_ids[i : i + max_calendars_per_request]
+            for i in range(0, len(calendar_ids), max_calendars_per_request)
+        ] or [calendar_ids]
+        bodies = [
+            _build_query_body(
+                shard,
+                time_min,
+                time_max,
+                time_zone=time_zone,
+                group_expansion_max=group_expansion_max,
+                calendar_expansion_max=calendar_expansion_max,
+            )
+            for shard in shards
+        ]
+
+        results = await asyncio.gather(
+            *(
+                self._transport.request("POST", "/freeBusy", json=body)
+                for body in bodies
+            )
+        )
+        if len(results) == 1:
+            return FreeBusyResponse.from_api_response(results[0])
+        return FreeBusyResponse.from_api_response(_merge_query_results(list(results)))
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
-import json
 import os
+import weakref
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 
+from . import _json
+
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
 DEFAULT_CREDENTIALS_PATH = "~/secrets/google-oauth/credentials.json"
 DEFAULT_TOKEN_PATH = "~/secrets/google-oauth/token.json"
 
+# Last token data read from or written to disk for each Credentials object,
+# so _save_token can skip rewriting an unchanged file.
+_SAVED_TOKENS: weakref.WeakKeyDictionary[Credentials, dict] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def load_credentials(
     credentials_path: str | Path = DEFAULT_CREDENTIALS_PATH,
@@ -21,6 +32,10 @@ def load_credentials(
 ) -> Credentials:
     """Load OAuth credentials from disk, refreshing if expired.
 
+    The access token is only refreshed when it is missing or its stored
+    expiry is near (google-auth treats tokens as expired a few minutes
+    early), so a fresh token costs no network round-trip.
+
     Args:
         credentials_path: Path to credentials.json file. Only used as a fallback
             when the token file does not contain client_id/client_secret.
@@ -32,8 +47,8 @@ def load_credentials(
     Raises:
         FileNotFoundError: If the token file doesn't exist.
     """
-    token_path = Path(os.path.expanduser(str(token_path)))
-    credentials_path = Path(os.path.expanduser(str(credentials_path)))
+    token_path = _resolve_path(str(token_path))
+    credentials_path = _resolve_path(str(credentials_path))
 
     if not token_path.exists():
         raise FileNotFoundError(
@@ -41,7 +56,7 @@ def load_credentials(
             "Run the OAuth flow to generate a token first."
         )
 
-    token_data = json.loads(token_path.read_text())
+    token_data = _json.loads(token_path.read_bytes())
 
     # Build credentials from the token file
     creds = Credentials(
@@ -51,39 +66,67 @@ def load_credentials(
         client_id=token_data.get("client_id"),
         client_secret=token_data.get("client_secret"),
         scopes=token_data.get("scopes", SCOPES),
+        expiry=_parse_expiry(token_data.get("expiry")),
     )
+    _SAVED_TOKENS[creds] = token_data
+
+    # Nothing to do while the access token is still valid
+    if creds.valid or not creds.refresh_token:
+        return creds
 
-    # If credentials are expired and we can refresh, do so
-    if creds.expired and creds.refresh_token:
-        creds.refresh(Request())
+    if creds.client_id and creds.client_secret:
+        creds.refresh(_refresh_request())
         # Save refreshed token back to disk
         _save_token(creds, token_path)
-
-    # If we still don't have valid credentials and have a credentials file,
-    # try to get client_id/client_secret from there for refresh
-    if not creds.valid and creds.refresh_token and credentials_path.exists():
-        cred_data = json.loads(credentials_path.read_text())
+    elif credentials_path.exists():
+        # The token file has no client_id/client_secret; try to get them
+        # from the credentials file for refresh
+        cred_data = _json.loads(credentials_path.read_bytes())
         # Handle both "installed" and "web" application types
         client_info = cred_data.get("installed") or cred_data.get("web", {})
         if client_info:
-            creds = Credentials(
-                token=creds.token,
-                refresh_token=creds.refresh_token,
-                token_uri=client_info.get(
-                    "token_uri", "https://oauth2.googleapis.com/token"
-                ),
-                client_id=client_info.get("client_id"),
-                client_secret=client_info.get("client_secret"),
-                scopes=SCOPES,
+            # Fill in the client fields on the existing credentials rather
+            # than rebuilding them; Credentials has no public setters.
+            creds._client_id = client_info.get("client_id")
+            creds._client_secret = client_info.get("client_secret")
+            creds._token_uri = client_info.get(
+                "token_uri", "https://oauth2.googleapis.com/token"
             )
-            creds.refresh(Request())
+            creds.refresh(_refresh_request())
             _save_token(creds, token_path)
 
     return creds
 
 
+@lru_cache(maxsize=None)
+def _refresh_request() -> Request:
+    """Return the shared transport used for token refreshes.
+
+    Each ``Request()`` wraps a new ``requests.Session`` with its own
+    connection pool, so one is reused to keep the connection alive across
+    refreshes in long-lived processes.
+    """
+    return Request()
+
+
+@lru_cache(maxsize=32)
+def _resolve_path(path: str) -> Path:
+    """Expand ``~`` in a path, memoized since the same paths recur per client."""
+    return Path(os.path.expanduser(path))
+
+
+def _parse_expiry(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored token expiry (naive UTC, as written by google-auth)."""
+    if not value:
+        return None
+    expiry = datetime.fromisoformat(value.rstrip("Z"))
+    if expiry.tzinfo is not None:
+        expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+    return expiry
+
+
 def _save_token(creds: Credentials, token_path: Path) -> None:
-    """Save credentials to the token file."""
+    """Save credentials to the token file, unless it is already up to date."""
     token_data = {
         "token": creds.token,
         "refresh_token": creds.refresh_token,
@@ -91,6 +134,10 @@ def _save_token(creds: Credentials, token_path: Path) -> None:
         "client_id": creds.client_id,
         "client_secret": creds.client_secret,
         "scopes": list(creds.scopes) if creds.scopes else SCOPES,
+        "expiry": creds.expiry.isoformat() + "Z" if creds.expiry else None,
     }
-    token_path.write_text(json.dumps(token_data, indent=2))
+    if _SAVED_TOKENS.get(creds) == token_data:
+        return
+    token_path.write_bytes(_json.dumps_indented(token_data))
     token_path.chmod(0o600)
+    _SAVED_TOKENS[creds] = token_data
@@ -0,0 +1,421 @@
+"""Batched request support for Google Calendar API."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar, cast
+
+from .calendars import CalendarsResource
+from .events import EventsResource
+from .freebusy import FreeBusyResource
+from .models import Calendar, Event, EventDateTime, FreeBusyResponse
+
+if TYPE_CHECKING:
+    from googleapiclient.discovery import Resource
+    from googleapiclient.http import HttpRequest
+
+T = TypeVar("T")
+
+#: Google Calendar accepts at most 50 calls per batch request.
+MAX_BATCH_SIZE = 50
+
+
+class BatchResult(Generic[T]):
+    """Placeholder for the result of a call queued in a :class:`Batch`.
+
+    The result becomes available once the batch has been executed.
+    """
+
+    def __init__(self, parse: Callable[[Any], T]) -> None:
+        self._parse = parse
+        self._done = False
+        self._value: Optional[T] = None
+        self._exception: Optional[BaseException] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the batch containing this call has been executed."""
+        return self._done
+
+    def result(self) -> T:
+        """Return the parsed result of the call.
+
+        Raises:
+            RuntimeError: If the batch has not been executed yet.
+            googleapiclient.errors.HttpError: If the call itself failed.
+        """
+        if not self._done:
+            raise RuntimeError("Batch has not been executed yet.")
+        if self._exception is not None:
+            raise self._exception
+        return self._value  # type: ignore[return-value]
+
+    def exception(self) -> Optional[BaseException]:
+        """Return the error raised by the call, or None if it succeeded."""
+        if not self._done:
+            raise RuntimeError("Batch has not been executed yet.")
+        return self._exception
+
+    def _resolve(
+        self, request_id: str, response: Any, exception: Optional[BaseException]
+    ) -> None:
+        """googleapiclient batch callback: store this call's response or error."""
+        if exception is None:
+            try:
+                self._value = self._parse(response)
+            except Exception as exc:  # noqa: BLE001
+                exception = exc
+        self._exception = exception
+        self._done = True
+
+
+class Batch:
+    """Queues Calendar API calls and sends them as multipart batch requests.
+
+    Usage::
+
+        with client.batch() as batch:
+            first = batch.events.get("primary", "event-id-1")
+            batch.events.delete("primary", "event-id-2")
+
+        event = first.result()
+
+    Methods on ``batch.events``, ``batch.calendars`` and ``batch.freebusy``
+    mirror the client's single-request methods but return
+    :class:`BatchResult` placeholders. Queued calls are sent to the
+    Calendar batch endpoint (``/batch/calendar/v3``) when the ``with``
+    block exits, split into requests of at most 50 calls each. Paginating
+    helpers such as ``list_all`` cannot be batched and are not offered.
+    """
+
+    def __init__(self, service: Resource) -> None:
+        self._service = service
+        self._pending: list[tuple[HttpRequest, BatchResult]] = []
+
+        self.events = BatchEvents(EventsResource(service, executor=self._add))
+        self.calendars = BatchCalendars(
+            CalendarsResource(service, executor=self._add)
+        )
+        self.freebusy = BatchFreeBusy(FreeBusyResource(service, executor=self._add))
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        # Don't send a half-built batch if the block raised
+        if exc_type is None:
+            self.execute()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _add(self, request: HttpRequest, parse: Callable[[Any], T]) -> BatchResult[T]:
+        """Queue a request instead of executing it."""
+        handle: BatchResult[T] = BatchResult(parse)
+        self._pending.append((request, handle))
+        return handle
+
+    def execute(self) -> None:
+        """Send all queued calls, resolving their :class:`BatchResult` handles.
+
+        Errors from individual calls are stored on their handles rather
+        than raised here. If a whole batch request fails, its error is
+        stored on every call in it and in the batches not yet sent, then
+        raised.
+        """
+        pending, self._pending = self._pending, []
+
+        for offset in range(0, len(pending), MAX_BATCH_SIZE):
+            batch_request = self._service.new_batch_http_request()
+            for request, handle in pending[offset : offset + MAX_BATCH_SIZE]:
+                batch_request.add(request, callback=handle._resolve)
+            try:
+                batch_request.execute()
+            except Exception as exc:
+                for _, handle in pending[offset:]:
+                    if not handle.done:
+                        handle._resolve("", None, exc)
+                raise
+
+
+# The facades below only narrow return types: a resource built with
+# Batch._add as its executor returns BatchResult handles at runtime, but
+# its methods are annotated with the unbatched result types.
+
+
+class BatchEvents:
+    """Batched counterparts of :class:`~gcal_sdk.events.EventsResource` methods."""
+
+    def __init__(self, resource: EventsResource) -> None:
+        self._resource = resource
+
+    def list(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 250,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        page_token: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+    ) -> BatchResult[list[Event]]:
+        """Queue :meth:`EventsResource.list`."""
+        return cast(
+            "BatchResult[list[Event]]",
+            self._resource.list(
+                calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                single_events=single_events,
+                order_by=order_by,
+                q=q,
+                page_token=page_token,
+                show_deleted=show_deleted,
+                fields=fields,
+            ),
+        )
+
+    def get(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        fields: Optional[str] = None,
+    ) -> BatchResult[Event]:
+        """Queue :meth:`EventsResource.get`."""
+        return cast(
+            "BatchResult[Event]",
+            self._resource.get(calendar_id, event_id, fields=fields),
+        )
+
+    def create(
+        self,
+        calendar_id: str = "primary",
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        start: Optional[datetime | EventDateTime] = None,
+        end: Optional[datetime | EventDateTime] = None,
+        attendees: Optional[list[str | dict]] = None,
+        recurrence: Optional[list[str]] = None,
+        time_zone: Optional[str] = None,
+        body: Optional[dict] = None,
+    ) -> BatchResult[Event]:
+        """Queue :meth:`EventsResource.create`."""
+        return cast(
+            "BatchResult[Event]",
+            self._resource.create(
+                calendar_id,
+                summary=summary,
+                description=description,
+                location=location,
+                start=start,
+                end=end,
+                attendees=attendees,
+                recurrence=recurrence,
+                time_zone=time_zone,
+                body=body,
+            ),
+        )
+
+    def update(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        body: dict,
+    ) -> BatchResult[Event]:
+        """Queue :meth:`EventsResource.update`."""
+        return cast(
+            "BatchResult[Event]",
+            self._resource.update(calendar_id, event_id, body=body),
+        )
+
+    def patch(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        start: Optional[datetime | EventDateTime] = None,
+        end: Optional[datetime | EventDateTime] = None,
+        attendees: Optional[list[str | dict]] = None,
+        recurrence: Optional[list[str]] = None,
+        time_zone: Optional[str] = None,
+        body: Optional[dict] = None,
+    ) -> BatchResult[Event]:
+        """Queue :meth:`EventsResource.patch`."""
+        return cast(
+            "BatchResult[Event]",
+            self._resource.patch(
+                calendar_id,
+                event_id,
+                summary=summary,
+                description=description,
+                location=location,
+                start=start,
+                end=end,
+                attendees=attendees,
+                recurrence=recurrence,
+                time_zone=time_zone,
+                body=body,
+            ),
+        )
+
+    def delete(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        send_updates: Optional[str] = None,
+    ) -> BatchResult[None]:
+        """Queue :meth:`EventsResource.delete`."""
+        return cast(
+            "BatchResult[None]",
+            self._resource.delete(calendar_id, event_id, send_updates=send_updates),
+        )
+
+    def move(
+        self,
+        calendar_id: str,
+        event_id: str,
+        destination_calendar_id: str,
+    ) -> BatchResult[Event]:
+        """Queue :meth:`EventsResource.move`."""
+        return cast(
+            "BatchResult[Event]",
+            self._resource.move(calendar_id, event_id, destination_calendar_id),
+        )
+
+    def instances(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 250,
+        fields: Optional[str] = None,
+    ) -> BatchResult[list[Event]]:
+        """Queue :meth:`EventsResource.instances`."""
+        return cast(
+            "BatchResult[list[Event]]",
+            self._resource.instances(
+                calendar_id,
+                event_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                fields=fields,
+            ),
+        )
+
+
+class BatchCalendars:
+    """Batched counterparts of :class:`~gcal_sdk.calendars.CalendarsResource` methods."""
+
+    def __init__(self, resource: CalendarsResource) -> None:
+        self._resource = resource
+
+    def list(
+        self,
+        *,
+        show_deleted: bool = False,
+        show_hidden: bool = False,
+        max_results: int = 250,
+        page_token: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> BatchResult[list[Calendar]]:
+        """Queue :meth:`CalendarsResource.list`."""
+        return cast(
+            "BatchResult[list[Calendar]]",
+            self._resource.list(
+                show_deleted=show_deleted,
+                show_hidden=show_hidden,
+                max_results=max_results,
+                page_token=page_token,
+                fields=fields,
+            ),
+        )
+
+    def get(
+        self,
+        calendar_id: str = "primary",
+        *,
+        fields: Optional[str] = None,
+    ) -> BatchResult[Calendar]:
+        """Queue :meth:`CalendarsResource.get`."""
+        return cast(
+            "BatchResult[Calendar]", self._resource.get(calendar_id, fields=fields)
+        )
+
+    def create(
+        self,
+        summary: str,
+        *,
+        description: Optional[str] = None,
+        time_zone: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> BatchResult[Calendar]:
+        """Queue :meth:`CalendarsResource.create`."""
+        return cast(
+            "BatchResult[Calendar]",
+            self._resource.create(
+                summary,
+                description=description,
+                time_zone=time_zone,
+                location=location,
+            ),
+        )
+
+    def delete(self, calendar_id: str) -> BatchResult[None]:
+        """Queue :meth:`CalendarsResource.delete`."""
+        return cast("BatchResult[None]", self._resource.delete(calendar_id))
+
+    def clear(self, calendar_id: str = "primary") -> BatchResult[None]:
+        """Queue :meth:`CalendarsResource.clear`."""
+        return cast("BatchResult[None]", self._resource.clear(calendar_id))
+
+
+class BatchFreeBusy:
+    """Batched counterpart of :meth:`FreeBusyResource.query`."""
+
+    def __init__(self, resource: FreeBusyResource) -> None:
+        self._resource = resource
+
+    def query(
+        self,
+        calendar_ids: list[str],
+        time_min: datetime,
+        time_max: datetime,
+        *,
+        time_zone: Optional[str] = None,
+        group_expansion_max: Optional[int] = None,
+        calendar_expansion_max: Optional[int] = None,
+        max_calendars_per_request: int = 50,
+    ) -> BatchResult[FreeBusyResponse]:
+        """Queue :meth:`FreeBusyResource.query`.
+
+        Raises:
+            ValueError: If *calendar_ids* needs more than one request.
+        """
+        return cast(
+            "BatchResult[FreeBusyResponse]",
+            self._resource.query(
+                calendar_ids,
+                time_min,
+                time_max,
+                time_zone=time_zone,
+                group_expansion_max=group_expansion_max,
+                calendar_expansion_max=calendar_expansion_max,
+                max_calendars_per_request=max_calendars_per_request,
+            ),
+        )
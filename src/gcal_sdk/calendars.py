@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from .models import Calendar
+from ._http import Executor, execute_now, ignore_response
+from .models import Calendar, api_fields_selector
 
 if TYPE_CHECKING:
     from googleapiclient.discovery import Resource
 
+# Partial-response selectors for exactly the fields the Calendar model reads
+_CALENDAR_FIELDS = api_fields_selector(Calendar)
+_CALENDAR_LIST_FIELDS = f"nextPageToken,items({_CALENDAR_FIELDS})"
+
 
 class CalendarsResource:
     """Provides methods for Google Calendar CalendarList operations."""
 
-    def __init__(self, service: Resource) -> None:
+    def __init__(self, service: Resource, *, executor: Executor = execute_now) -> None:
         self._service = service
         self._calendar_list = service.calendarList()
         self._calendars = service.calendars()
+        self._execute = executor
 
     @staticmethod
     def _build_list_kwargs(
@@ -25,12 +31,14 @@ class CalendarsResource:
         show_hidden: bool = False,
         max_results: int = 250,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> dict:
         """Build kwargs dict for the calendarList().list() API call."""
         kwargs: dict = {
             "showDeleted": show_deleted,
             "showHidden": show_hidden,
             "maxResults": max_results,
+            "fields": fields if fields is not None else _CALENDAR_LIST_FIELDS,
         }
         if page_token is not None:
             kwargs["pageToken"] = page_token
@@ -43,6 +51,7 @@ class CalendarsResource:
         show_hidden: bool = False,
         max_results: int = 250,
         page_token: Optional[str] = None,
+        fields: Optional[str] = None,
     ) -> list[Calendar]:
         """List calendars in the user's calendar list.
 
@@ -51,6 +60,8 @@ class CalendarsResource:
             show_hidden: Whether to show hidden calendars.
             max_results: Maximum number of calendars to return.
             page_token: Token for paginated results.
+            fields: Partial-response selector. Defaults to the fields the
+                Calendar model reads; pass "*" for the full resources.
 
         Returns:
             List of Calendar objects.
@@ -60,44 +71,74 @@ class CalendarsResource:
             show_hidden=show_hidden,
             max_results=max_results,
             page_token=page_token,
+            fields=fields,
         )
 
-        result = self._calendar_list.list(**kwargs).execute()
-        items = result.get("items", [])
-        return [Calendar.from_api_response(item) for item in items]
+        return self._execute(
+            self._calendar_list.list(**kwargs), _parse_calendar_items
+        )
 
     def list_all(
         self,
         *,
         show_deleted: bool = False,
         show_hidden: bool = False,
+        fields: Optional[str] = None,
     ) -> list[Calendar]:
         """List all calendars, automatically paginating.
 
+        A custom *fields* selector must include nextPageToken. Each page
+        depends on the previous page's token, so this always executes
+        immediately, even on a batch's resources.
+
         Returns:
             Complete list of Calendar objects across all pages.
         """
-        all_calendars: list[Calendar] = []
-        page_token: Optional[str] = None
-
-        while True:
-            kwargs = self._build_list_kwargs(
+        return list(
+            self.iter_all(
                 show_deleted=show_deleted,
                 show_hidden=show_hidden,
-                page_token=page_token,
+                fields=fields,
             )
+        )
+
+    def iter_all(
+        self,
+        *,
+        show_deleted: bool = False,
+        show_hidden: bool = False,
+        fields: Optional[str] = None,
+    ) -> Iterator[Calendar]:
+        """Iterate over all calendars, fetching one page at a time.
+
+        Like list_all(), but the next page is only requested once the
+        current one has been consumed. Same arguments as list_all().
 
+        Yields:
+            Calendar objects, across all pages.
+        """
+        # Built once; only the page token changes between pages
+        kwargs = self._build_list_kwargs(
+            show_deleted=show_deleted,
+            show_hidden=show_hidden,
+            fields=fields,
+        )
+
+        while True:
             result = self._calendar_list.list(**kwargs).execute()
-            items = result.get("items", [])
-            all_calendars.extend(Calendar.from_api_response(item) for item in items)
+            yield from _parse_calendar_items(result)
 
             page_token = result.get("nextPageToken")
             if not page_token:
                 break
+            kwargs["pageToken"] = page_token
 
-        return all_calendars
-
-    def get(self, calendar_id: str = "primary") -> Calendar:
+    def get(
+        self,
+        calendar_id: str = "primary",
+        *,
+        fields: Optional[str] = None,
+    ) -> Calendar:
         """Get a calendar by ID.
 
         For CalendarList entries this returns the user's view of the
@@ -105,12 +146,19 @@ class CalendarsResource:
 
         Args:
             calendar_id: Calendar identifier (default "primary").
+            fields: Partial-response selector. Defaults to the fields the
+                Calendar model reads; pass "*" for the full resource.
 
         Returns:
             The Calendar object.
         """
-        result = self._calendar_list.get(calendarId=calendar_id).execute()
-        return Calendar.from_api_response(result)
+        return self._execute(
+            self._calendar_list.get(
+                calendarId=calendar_id,
+                fields=fields if fields is not None else _CALENDAR_FIELDS,
+            ),
+            Calendar.from_api_response,
+        )
 
     def create(
         self,
@@ -131,16 +179,16 @@ class CalendarsResource:
         Returns:
             The created Calendar.
         """
-        body: dict = {"summary": summary}
-        if description is not None:
-            body["description"] = description
-        if time_zone is not None:
-            body["timeZone"] = time_zone
-        if location is not None:
-            body["location"] = location
+        body = _build_calendar_body(
+            summary,
+            description=description,
+            time_zone=time_zone,
+            location=location,
+        )
 
-        result = self._calendars.insert(body=body).execute()
-        return Calendar.from_api_response(result)
+        return self._execute(
+            self._calendars.insert(body=body), Calendar.from_api_response
+        )
 
     def delete(self, calendar_id: str) -> None:
         """Delete a secondary calendar.
@@ -148,7 +196,9 @@ class CalendarsResource:
         Args:
             calendar_id: Calendar identifier. Cannot be "primary".
         """
-        self._calendars.delete(calendarId=calendar_id).execute()
+        return self._execute(
+            self._calendars.delete(calendarId=calendar_id), ignore_response
+        )
 
     def clear(self, calendar_id: str = "primary") -> None:
         """Clear all events from a calendar.
@@ -156,4 +206,29 @@ class CalendarsResource:
         Args:
             calendar_id: Calendar identifier.
         """
-        self._calendars.clear(calendarId=calendar_id).execute()
+        return self._execute(
+            self._calendars.clear(calendarId=calendar_id), ignore_response
+        )
+
+
+def _parse_calendar_items(result: dict) -> list[Calendar]:
+    """Parse the ``items`` of a calendarList response into Calendar objects."""
+    return Calendar.from_api_items(result.get("items", []))
+
+
+def _build_calendar_body(
+    summary: str,
+    *,
+    description: Optional[str] = None,
+    time_zone: Optional[str] = None,
+    location: Optional[str] = None,
+) -> dict:
+    """Build a calendar body dict for calendars().insert()."""
+    body: dict = {"summary": summary}
+    if description is not None:
+        body["description"] = description
+    if time_zone is not None:
+        body["timeZone"] = time_zone
+    if location is not None:
+        body["location"] = location
+    return body
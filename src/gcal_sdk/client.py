@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import Resource, build_from_document
+from googleapiclient.http import build_http
 
+from . import _json
+from ._http import FastJsonModel, Http2Adapter
 from .auth import DEFAULT_CREDENTIALS_PATH, DEFAULT_TOKEN_PATH, load_credentials
+from .batch import Batch
 from .calendars import CalendarsResource
 from .events import EventsResource
 from .freebusy import FreeBusyResource
@@ -38,6 +45,7 @@ class GCalClient:
         credentials: Optional[Credentials] = None,
         credentials_path: str | Path = DEFAULT_CREDENTIALS_PATH,
         token_path: str | Path = DEFAULT_TOKEN_PATH,
+        http2: bool = False,
     ) -> None:
         """Initialize the client.
 
@@ -46,6 +54,10 @@ class GCalClient:
                 credentials_path and token_path are ignored.
             credentials_path: Path to the OAuth client credentials JSON file.
             token_path: Path to the stored token JSON file.
+            http2: Send requests over a shared, thread-safe HTTP/2
+                connection pool instead of httplib2 (requires the
+                ``async`` extra). Useful when calling the client from
+                many threads at once.
         """
         if credentials is None:
             credentials = load_credentials(
@@ -54,11 +66,28 @@ class GCalClient:
             )
 
         self._credentials = credentials
-        self._service = build("calendar", "v3", credentials=credentials)
+        self._service = _build_service(credentials, http2)
 
-        self.events = EventsResource(self._service)
+        self.events = EventsResource(self._service, credentials=credentials)
         self.calendars = CalendarsResource(self._service)
-        self.freebusy = FreeBusyResource(self._service)
+        self.freebusy = FreeBusyResource(
+            self._service, credentials=credentials, thread_safe_http=http2
+        )
+
+    def batch(self) -> Batch:
+        """Start a batch of calls sent together in as few HTTP requests as possible.
+
+        Usage::
+
+            with client.batch() as batch:
+                results = [batch.events.get("primary", eid) for eid in event_ids]
+
+            events = [r.result() for r in results]
+
+        Returns:
+            A Batch to use as a context manager; see :class:`~gcal_sdk.batch.Batch`.
+        """
+        return Batch(self._service)
 
     @property
     def service(self) -> Any:
@@ -69,3 +98,26 @@ class GCalClient:
     def credentials(self) -> Credentials:
         """Access the underlying OAuth credentials."""
         return self._credentials
+
+
+@lru_cache(maxsize=1)
+def _discovery_document() -> str:
+    """Return the Calendar v3 discovery document bundled with googleapiclient."""
+    return discovery_cache.get_static_doc("calendar", "v3")
+
+
+def _build_service(credentials: Credentials, http2: bool = False) -> Resource:
+    """Build the Calendar API Resource on its own authorized connection.
+
+    Every client gets its own AuthorizedHttp, so clients handed to
+    different threads never share an httplib2 connection (with *http2*,
+    the underlying HTTP/2 pool is shared, which is thread-safe). Only the
+    bundled discovery document is read once; it is parsed per client
+    because the Resource rewrites the parsed method descriptions in place
+    as collections such as ``events()`` are created.
+    """
+    transport = Http2Adapter() if http2 else build_http()
+    http = AuthorizedHttp(credentials, http=transport)
+    return build_from_document(
+        _json.loads(_discovery_document()), http=http, model=FastJsonModel()
+    )
@@ -3,20 +3,38 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import IO, TYPE_CHECKING, Generator, Iterator, Optional
 
-from .models import Event, EventDateTime
+import httplib2
+from googleapiclient.errors import HttpError
+
+from ._http import GZIP_USER_AGENT, Executor, execute_now, ignore_response
+from .models import Event, EventDateTime, api_fields_selector
 
 if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import Resource
 
+# Partial-response selectors for exactly the fields the Event model reads
+# ("calendarId" is an SDK-side field, not part of the API resource)
+_EVENT_FIELDS = api_fields_selector(Event, exclude={"calendarId"})
+_EVENT_LIST_FIELDS = f"nextPageToken,items({_EVENT_FIELDS})"
+
 
 class EventsResource:
     """Provides methods for Google Calendar Events operations."""
 
-    def __init__(self, service: Resource) -> None:
+    def __init__(
+        self,
+        service: Resource,
+        *,
+        credentials: Optional[Credentials] = None,
+        executor: Executor = execute_now,
+    ) -> None:
         self._service = service
+        self._credentials = credentials
         self._events = service.events()
+        self._execute = executor
 
     @staticmethod
     def _build_list_kwargs(
@@ -30,6 +48,7 @@ class EventsResource:
         q: Optional[str] = None,
         page_token: Optional[str] = None,
         show_deleted: bool = False,
+        fields: Optional[str] = None,
     ) -> dict:
         """Build kwargs dict for the events().list() API call."""
         kwargs: dict = {
@@ -37,6 +56,7 @@ class EventsResource:
             "maxResults": max_results,
             "singleEvents": single_events,
             "showDeleted": show_deleted,
+            "fields": fields if fields is not None else _EVENT_LIST_FIELDS,
         }
         if time_min is not None:
             kwargs["timeMin"] = _ensure_isoformat(time_min)
@@ -62,6 +82,7 @@ class EventsResource:
         q: Optional[str] = None,
         page_token: Optional[str] = None,
         show_deleted: bool = False,
+        fields: Optional[str] = None,
     ) -> list[Event]:
         """List events from a calendar.
 
@@ -76,6 +97,8 @@ class EventsResource:
             q: Free text search query.
             page_token: Token for paginated results.
             show_deleted: Whether to include deleted events.
+            fields: Partial-response selector. Defaults to the fields the
+                Event model reads; pass "*" for the full resources.
 
         Returns:
             List of Event objects.
@@ -90,11 +113,10 @@ class EventsResource:
             q=q,
             page_token=page_token,
             show_deleted=show_deleted,
+            fields=fields,
         )
 
-        result = self._events.list(**kwargs).execute()
-        items = result.get("items", [])
-        return [Event.from_api_response(item) for item in items]
+        return self._execute(self._events.list(**kwargs), _parse_event_items)
 
     def list_all(
         self,
@@ -106,53 +128,225 @@ class EventsResource:
         order_by: Optional[str] = "startTime",
         q: Optional[str] = None,
         show_deleted: bool = False,
+        fields: Optional[str] = None,
     ) -> list[Event]:
         """List all events, automatically paginating.
 
-        Same arguments as list() except max_results and page_token.
+        Same arguments as list() except max_results and page_token; a
+        custom *fields* selector must include nextPageToken. Each page
+        depends on the previous page's token, so this always executes
+        immediately, even on a batch's resources.
 
         Returns:
             Complete list of Event objects across all pages.
         """
-        all_events: list[Event] = []
-        page_token: Optional[str] = None
-
-        while True:
-            kwargs = self._build_list_kwargs(
+        return list(
+            self.iter_all(
                 calendar_id,
                 time_min=time_min,
                 time_max=time_max,
                 single_events=single_events,
                 order_by=order_by,
                 q=q,
-                page_token=page_token,
                 show_deleted=show_deleted,
+                fields=fields,
             )
+        )
+
+    def iter_all(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+    ) -> Iterator[Event]:
+        """Iterate over all events, fetching one page at a time.
+
+        Like list_all(), but only the current page is held in memory and
+        the next page is not requested until the current one has been
+        consumed, so stopping early skips the remaining pages.
+
+        Same arguments as list_all().
+
+        Yields:
+            Event objects, across all pages.
+        """
+        # Built once; only the page token changes between pages
+        kwargs = self._build_list_kwargs(
+            calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            single_events=single_events,
+            order_by=order_by,
+            q=q,
+            show_deleted=show_deleted,
+            fields=fields,
+        )
 
+        while True:
             result = self._events.list(**kwargs).execute()
-            items = result.get("items", [])
-            all_events.extend(Event.from_api_response(item) for item in items)
+            yield from _parse_event_items(result)
 
             page_token = result.get("nextPageToken")
             if not page_token:
                 break
+            kwargs["pageToken"] = page_token
+
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+    ) -> Iterator[Event]:
+        """Stream all events, parsing each one as soon as it is received.
+
+        Requires the ``stream`` extra (ijson). Unlike iter_all(), pages
+        are not buffered: each Event is yielded while the rest of its page
+        is still downloading, so memory stays at one event rather than
+        one page.
+
+        Same arguments as list_all().
+
+        Yields:
+            Event objects, across all pages.
+
+        Raises:
+            googleapiclient.errors.HttpError: If the API returns an error
+                status, as for the other methods.
+        """
+        from google.auth.transport.requests import AuthorizedSession
+
+        try:
+            import ijson  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "iter_events() requires ijson. "
+                "Install it with: pip install 'gcal-sdk-ldraney[stream]'"
+            ) from exc
 
-        return all_events
+        if self._credentials is None:
+            raise RuntimeError("iter_events() requires OAuth credentials.")
 
-    def get(self, calendar_id: str, event_id: str) -> Event:
+        kwargs = self._build_list_kwargs(
+            calendar_id,
+            time_min=time_min,
+            time_max=time_max,
+            single_events=single_events,
+            order_by=order_by,
+            q=q,
+            show_deleted=show_deleted,
+            fields=fields,
+        )
+
+        with AuthorizedSession(self._credentials) as session:
+            while True:
+                uri = self._events.list(**kwargs).uri
+
+                with session.get(
+                    uri, headers={"User-Agent": GZIP_USER_AGENT}, stream=True
+                ) as response:
+                    if response.status_code >= 400:
+                        raise HttpError(
+                            httplib2.Response(
+                                {**response.headers, "status": response.status_code}
+                            ),
+                            response.content,
+                            uri=uri,
+                        )
+                    response.raw.decode_content = True
+                    page_token = yield from _stream_event_items(response.raw)
+
+                if not page_token:
+                    break
+                kwargs["pageToken"] = page_token
+
+    async def list_all_async(
+        self,
+        calendar_id: str = "primary",
+        *,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        single_events: bool = True,
+        order_by: Optional[str] = "startTime",
+        q: Optional[str] = None,
+        show_deleted: bool = False,
+        fields: Optional[str] = None,
+        max_workers: int = 10,
+    ) -> list[Event]:
+        """List all events asynchronously, fetching pages concurrently.
+
+        A one-off shortcut for ``AsyncGCalClient().events.list_all()``
+        (see :mod:`gcal_sdk.aio`); requires the ``async`` extra (httpx).
+        When both *time_min* and *time_max* are given, the range is split
+        into *max_workers* equal sub-ranges that are paginated in
+        parallel; events spanning a boundary are returned once. Within
+        each sub-range, the next page is requested before the current one
+        is parsed.
+
+        Same arguments as list_all(), plus:
+
+        Args:
+            max_workers: Number of sub-ranges to fetch concurrently.
+
+        Returns:
+            Complete list of Event objects across all pages.
+        """
+        from ._async_http import AsyncTransport
+        from .aio.events import AsyncEventsResource
+
+        if self._credentials is None:
+            raise RuntimeError("list_all_async() requires OAuth credentials.")
+
+        async with AsyncTransport(self._credentials) as transport:
+            return await AsyncEventsResource(transport).list_all(
+                calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                single_events=single_events,
+                order_by=order_by,
+                q=q,
+                show_deleted=show_deleted,
+                fields=fields,
+                max_workers=max_workers,
+            )
+
+    def get(
+        self,
+        calendar_id: str,
+        event_id: str,
+        *,
+        fields: Optional[str] = None,
+    ) -> Event:
         """Get a single event by ID.
 
         Args:
             calendar_id: Calendar identifier.
             event_id: Event identifier.
+            fields: Partial-response selector. Defaults to the fields the
+                Event model reads; pass "*" for the full resource.
 
         Returns:
             The Event object.
         """
-        result = (
-            self._events.get(calendarId=calendar_id, eventId=event_id).execute()
+        return self._execute(
+            self._events.get(
+                calendarId=calendar_id,
+                eventId=event_id,
+                fields=fields if fields is not None else _EVENT_FIELDS,
+            ),
+            Event.from_api_response,
         )
-        return Event.from_api_response(result)
 
     def create(
         self,
@@ -200,8 +394,10 @@ class EventsResource:
             body=body,
         )
 
-        result = self._events.insert(calendarId=calendar_id, body=body).execute()
-        return Event.from_api_response(result)
+        return self._execute(
+            self._events.insert(calendarId=calendar_id, body=body),
+            Event.from_api_response,
+        )
 
     def update(
         self,
@@ -220,12 +416,10 @@ class EventsResource:
         Returns:
             The updated Event.
         """
-        result = (
-            self._events.update(
-                calendarId=calendar_id, eventId=event_id, body=body
-            ).execute()
+        return self._execute(
+            self._events.update(calendarId=calendar_id, eventId=event_id, body=body),
+            Event.from_api_response,
         )
-        return Event.from_api_response(result)
 
     def patch(
         self,
@@ -272,12 +466,10 @@ class EventsResource:
             body=body,
         )
 
-        result = (
-            self._events.patch(
-                calendarId=calendar_id, eventId=event_id, body=body
-            ).execute()
+        return self._execute(
+            self._events.patch(calendarId=calendar_id, eventId=event_id, body=body),
+            Event.from_api_response,
         )
-        return Event.from_api_response(result)
 
     def delete(
         self,
@@ -296,7 +488,7 @@ class EventsResource:
         kwargs: dict = {"calendarId": calendar_id, "eventId": event_id}
         if send_updates is not None:
             kwargs["sendUpdates"] = send_updates
-        self._events.delete(**kwargs).execute()
+        return self._execute(self._events.delete(**kwargs), ignore_response)
 
     def move(
         self,
@@ -314,14 +506,14 @@ class EventsResource:
         Returns:
             The moved Event.
         """
-        result = (
+        return self._execute(
             self._events.move(
                 calendarId=calendar_id,
                 eventId=event_id,
                 destination=destination_calendar_id,
-            ).execute()
+            ),
+            Event.from_api_response,
         )
-        return Event.from_api_response(result)
 
     def instances(
         self,
@@ -331,6 +523,7 @@ class EventsResource:
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None,
         max_results: int = 250,
+        fields: Optional[str] = None,
     ) -> list[Event]:
         """List instances of a recurring event.
 
@@ -340,6 +533,8 @@ class EventsResource:
             time_min: Lower bound for instance start time.
             time_max: Upper bound for instance start time.
             max_results: Maximum instances to return.
+            fields: Partial-response selector. Defaults to the fields the
+                Event model reads; pass "*" for the full resources.
 
         Returns:
             List of Event instances.
@@ -348,15 +543,45 @@ class EventsResource:
             "calendarId": calendar_id,
             "eventId": event_id,
             "maxResults": max_results,
+            "fields": fields if fields is not None else _EVENT_LIST_FIELDS,
         }
         if time_min is not None:
             kwargs["timeMin"] = _ensure_isoformat(time_min)
         if time_max is not None:
             kwargs["timeMax"] = _ensure_isoformat(time_max)
 
-        result = self._events.instances(**kwargs).execute()
-        items = result.get("items", [])
-        return [Event.from_api_response(item) for item in items]
+        return self._execute(self._events.instances(**kwargs), _parse_event_items)
+
+
+def _parse_event_items(result: dict) -> list[Event]:
+    """Parse the ``items`` of an events list response into Event objects."""
+    return Event.from_api_items(result.get("items", []))
+
+
+def _stream_event_items(stream: IO[bytes]) -> Generator[Event, None, Optional[str]]:
+    """Yield Events from an events list response body as each one completes.
+
+    Returns the page's nextPageToken, wherever it appears in the body.
+    """
+    import ijson
+    from ijson.common import ObjectBuilder
+
+    page_token: Optional[str] = None
+    builder: Optional[ObjectBuilder] = None
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "items.item" and event == "end_map":
+                yield Event.from_api_response(builder.value)
+                builder = None
+        elif prefix == "items.item" and event == "start_map":
+            builder = ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "nextPageToken":
+            page_token = value
+
+    return page_token
 
 
 def _build_event_body(
@@ -390,22 +615,29 @@ def _build_event_body(
     if end is not None:
         result["end"] = _to_event_datetime(end, time_zone)
     if attendees is not None:
-        result["attendees"] = [
-            {"email": a} if isinstance(a, str) else a for a in attendees
-        ]
+        result["attendees"] = _normalize_attendees(attendees)
     if recurrence is not None:
         result["recurrence"] = recurrence
     return result
 
 
+def _normalize_attendees(attendees: list[str | dict]) -> list[dict]:
+    """Convert attendee emails to attendee dicts, passing dicts through."""
+    return [{"email": a} if isinstance(a, str) else a for a in attendees]
+
+
+_NAIVE_DATETIME_MSG = (
+    "Datetime must be timezone-aware. Use datetime.now(timezone.utc) "
+    "or attach a timezone with .replace(tzinfo=...)."
+)
+_isoformat = datetime.isoformat
+
+
 def _ensure_isoformat(dt: datetime) -> str:
     """Ensure a datetime is in ISO 8601 format with timezone."""
     if dt.tzinfo is None:
-        raise ValueError(
-            "Datetime must be timezone-aware. Use datetime.now(timezone.utc) "
-            "or attach a timezone with .replace(tzinfo=...)."
-        )
-    return dt.isoformat()
+        raise ValueError(_NAIVE_DATETIME_MSG)
+    return _isoformat(dt)
 
 
 def _to_event_datetime(
@@ -416,12 +648,7 @@ def _to_event_datetime(
     if isinstance(value, EventDateTime):
         return value.to_api_dict()
     # It's a plain datetime — must be timezone-aware
-    if value.tzinfo is None:
-        raise ValueError(
-            "Datetime must be timezone-aware. Use datetime.now(timezone.utc) "
-            "or attach a timezone with .replace(tzinfo=...)."
-        )
-    result: dict = {"dateTime": value.isoformat()}
+    result: dict = {"dateTime": _ensure_isoformat(value)}
     if time_zone is not None:
         result["timeZone"] = time_zone
     return result
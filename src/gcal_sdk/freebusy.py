@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
+
+from ._http import Executor, execute_now
 from .models import FreeBusyResponse
 
 if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
     from googleapiclient.discovery import Resource
 
 
 class FreeBusyResource:
     """Provides methods for Google Calendar FreeBusy operations."""
 
-    def __init__(self, service: Resource) -> None:
+    def __init__(
+        self,
+        service: Resource,
+        *,
+        credentials: Optional[Credentials] = None,
+        executor: Executor = execute_now,
+        thread_safe_http: bool = False,
+    ) -> None:
         self._service = service
+        self._credentials = credentials
         self._freebusy = service.freebusy()
+        self._execute = executor
+        # The HTTP/2 transport can be shared by shard threads; httplib2 cannot
+        self._thread_safe_http = thread_safe_http
+        # Idle per-shard connections, reused across queries
+        self._idle_http: list[AuthorizedHttp] = []
 
     def query(
         self,
@@ -27,9 +46,17 @@ class FreeBusyResource:
         time_zone: Optional[str] = None,
         group_expansion_max: Optional[int] = None,
         calendar_expansion_max: Optional[int] = None,
+        max_calendars_per_request: int = 50,
+        max_workers: int = 10,
     ) -> FreeBusyResponse:
         """Query free/busy information for a set of calendars.
 
+        The API accepts at most 50 calendars per request, so longer
+        *calendar_ids* lists are split into shards that are queried
+        concurrently and merged into a single response. Without
+        credentials the shards are queried one after another instead.
+        Queries that need sharding cannot be batched.
+
         Args:
             calendar_ids: List of calendar identifiers to query.
             time_min: Start of the time range.
@@ -39,29 +66,117 @@ class FreeBusyResource:
                 expand for group calendars.
             calendar_expansion_max: Maximum number of calendars to
                 expand for calendar groups.
+            max_calendars_per_request: Shard size for long calendar lists.
+            max_workers: Maximum number of shards queried at once.
 
         Returns:
             FreeBusyResponse with busy periods per calendar.
 
         Raises:
-            ValueError: If datetimes are not timezone-aware.
+            ValueError: If datetimes are not timezone-aware, or if a
+                batched query needs more than one request.
         """
-        if time_min.tzinfo is None or time_max.tzinfo is None:
+        shards = [
+            calendar_ids[i : i + max_calendars_per_request]
+            for i in range(0, len(calendar_ids), max_calendars_per_request)
+        ] or [calendar_ids]
+        bodies = [
+            _build_query_body(
+                shard,
+                time_min,
+                time_max,
+                time_zone=time_zone,
+                group_expansion_max=group_expansion_max,
+                calendar_expansion_max=calendar_expansion_max,
+            )
+            for shard in shards
+        ]
+
+        if len(bodies) == 1:
+            return self._execute(
+                self._freebusy.query(body=bodies[0]),
+                FreeBusyResponse.from_api_response,
+            )
+
+        if self._execute is not execute_now:
             raise ValueError(
-                "time_min and time_max must be timezone-aware datetimes."
+                "A batched free/busy query can cover at most "
+                f"{max_calendars_per_request} calendars; got {len(calendar_ids)}."
             )
+        if self._credentials is None and not self._thread_safe_http:
+            # No private connections can be made, and the service's
+            # httplib2 connection must not be shared between threads
+            results = [self._freebusy.query(body=body).execute() for body in bodies]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(self._query_shard, bodies))
+        return FreeBusyResponse.from_api_response(_merge_query_results(results))
+
+    def _query_shard(self, body: dict) -> dict:
+        """Run one shard of a query on a connection no other thread is using."""
+        request = self._freebusy.query(body=body)
+        if self._thread_safe_http:
+            return request.execute()
+        http = self._checkout_http()
+        try:
+            return request.execute(http=http)
+        finally:
+            self._idle_http.append(http)
+
+    def _checkout_http(self) -> AuthorizedHttp:
+        """Take an idle authorized connection, or open a new one.
+
+        httplib2 is not thread-safe, so each in-flight shard needs its own
+        connection. Returned connections keep their TLS session alive for
+        later queries. (list.pop and append are atomic.)
+        """
+        try:
+            return self._idle_http.pop()
+        except IndexError:
+            return AuthorizedHttp(self._credentials, http=build_http())
+
+
+def _build_query_body(
+    calendar_ids: list[str],
+    time_min: datetime,
+    time_max: datetime,
+    *,
+    time_zone: Optional[str] = None,
+    group_expansion_max: Optional[int] = None,
+    calendar_expansion_max: Optional[int] = None,
+) -> dict:
+    """Build the request body for freebusy().query()."""
+    if time_min.tzinfo is None or time_max.tzinfo is None:
+        raise ValueError(
+            "time_min and time_max must be timezone-aware datetimes."
+        )
+
+    body: dict = {
+        "timeMin": time_min.isoformat(),
+        "timeMax": time_max.isoformat(),
+        "items": [{"id": cal_id} for cal_id in calendar_ids],
+    }
+    if time_zone is not None:
+        body["timeZone"] = time_zone
+    if group_expansion_max is not None:
+        body["groupExpansionMax"] = group_expansion_max
+    if calendar_expansion_max is not None:
+        body["calendarExpansionMax"] = calendar_expansion_max
+    return body
+
 
-        body: dict = {
-            "timeMin": time_min.isoformat(),
-            "timeMax": time_max.isoformat(),
-            "items": [{"id": cal_id} for cal_id in calendar_ids],
-        }
-        if time_zone is not None:
-            body["timeZone"] = time_zone
-        if group_expansion_max is not None:
-            body["groupExpansionMax"] = group_expansion_max
-        if calendar_expansion_max is not None:
-            body["calendarExpansionMax"] = calendar_expansion_max
-
-        result = self._freebusy.query(body=body).execute()
-        return FreeBusyResponse.from_api_response(result)
+def _merge_query_results(results: list[dict]) -> dict:
+    """Merge raw freebusy().query() responses from several shards."""
+    merged = dict(results[0])
+    for key in ("calendars", "groups"):
+        combined: dict = {}
+        for result in results:
+            for cal_id, info in result.get(key, {}).items():
+                if cal_id in combined and key == "calendars":
+                    existing = combined[cal_id]
+                    existing["busy"] = existing.get("busy", []) + info.get("busy", [])
+                else:
+                    combined[cal_id] = dict(info)
+        if combined:
+            merged[key] = combined
+    return merged
@@ -1,9 +1,10 @@
 """Pydantic v2 models for Google Calendar API responses."""
 
 import datetime as dt
-from typing import Optional
+import typing
+from typing import Iterable, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
 
 class EventDateTime(BaseModel):
@@ -105,6 +106,11 @@ class Event(BaseModel):
         """Create an Event from a raw Google Calendar API response dict."""
         return cls.model_validate(data)
 
+    @classmethod
+    def from_api_items(cls, items: list[dict]) -> list["Event"]:
+        """Create Events from the ``items`` of a list response in one call."""
+        return _items_adapter(cls).validate_python(items)
+
 
 class Calendar(BaseModel):
     """A Google Calendar calendar (from CalendarList)."""
@@ -135,6 +141,11 @@ class Calendar(BaseModel):
         """Create a Calendar from a raw Google Calendar API response dict."""
         return cls.model_validate(data)
 
+    @classmethod
+    def from_api_items(cls, items: list[dict]) -> list["Calendar"]:
+        """Create Calendars from the ``items`` of a list response in one call."""
+        return _items_adapter(cls).validate_python(items)
+
 
 class BusyPeriod(BaseModel):
     """A period during which a calendar is busy."""
@@ -149,6 +160,13 @@ class CalendarFreeBusy(BaseModel):
     busy: list[BusyPeriod] = Field(default_factory=list)
     errors: Optional[list[dict]] = None
 
+    def is_busy(self, start: dt.datetime, end: dt.datetime) -> bool:
+        """Whether any busy period overlaps the range [start, end).
+
+        Both datetimes must be timezone-aware.
+        """
+        return any(p.start < end and start < p.end for p in self.busy)
+
 
 class FreeBusyResponse(BaseModel):
     """Response from a free/busy query."""
@@ -164,3 +182,47 @@ class FreeBusyResponse(BaseModel):
     def from_api_response(cls, data: dict) -> "FreeBusyResponse":
         """Create a FreeBusyResponse from a raw Google Calendar API response dict."""
         return cls.model_validate(data)
+
+
+# pydantic-core compiles one validator per schema; validating a whole page
+# through a list[Model] adapter avoids a Python-level call per item.
+_ITEM_ADAPTERS: dict[type, TypeAdapter] = {}
+
+
+def _items_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Return the (cached) ``list[model]`` TypeAdapter."""
+    adapter = _ITEM_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _ITEM_ADAPTERS[model] = TypeAdapter(list[model])
+    return adapter
+
+
+def api_fields_selector(
+    model: type[BaseModel], *, exclude: Iterable[str] = ()
+) -> str:
+    """Build a partial-response ``fields`` selector for a model.
+
+    Lists the API name of every field on *model*, recursing into nested
+    models, e.g. ``"id,start(date,dateTime,timeZone),attendees(email,...)"``.
+    Names in *exclude* (API names) are left out.
+    """
+    skip = set(exclude)
+    parts = []
+    for name, info in model.model_fields.items():
+        key = info.alias or name
+        if key in skip:
+            continue
+        nested = _nested_model(info.annotation)
+        parts.append(f"{key}({api_fields_selector(nested)})" if nested else key)
+    return ",".join(parts)
+
+
+def _nested_model(annotation: object) -> Optional[type[BaseModel]]:
+    """Return the model inside e.g. ``Optional[list[Attendee]]``, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        nested = _nested_model(arg)
+        if nested is not None:
+            return nested
+    return None
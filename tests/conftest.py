@@ -5,6 +5,7 @@ after all tests complete. Tests run against the real Google Calendar API.
 """
 
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -17,6 +18,13 @@ def client() -> GCalClient:
     return GCalClient()
 
 
+@pytest.fixture
+def time_window() -> tuple[datetime, datetime]:
+    """Return (now, now + 1 day) in UTC, for queries over the next day."""
+    now = datetime.now(timezone.utc)
+    return now, now + timedelta(days=1)
+
+
 @pytest.fixture(scope="session")
 def test_calendar_id(client: GCalClient):
     """Create a temporary test calendar and delete it after the session.
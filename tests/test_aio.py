@@ -0,0 +1,165 @@
+"""Tests for the asyncio client, against the API and a mocked transport."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from gcal_sdk import GCalClient
+
+httpx = pytest.importorskip("httpx")
+
+from gcal_sdk._async_http import BASE_URL, AsyncTransport  # noqa: E402
+from gcal_sdk.aio import AsyncGCalClient  # noqa: E402
+from gcal_sdk.aio import AsyncCalendarsResource, AsyncEventsResource  # noqa: E402
+
+
+class TestAsyncClient:
+    """Tests for AsyncGCalClient against the real API."""
+
+    def test_event_lifecycle(self, client: GCalClient, test_calendar_id: str):
+        """Create, fetch and delete an event through the async client."""
+        start = datetime.now(timezone.utc) + timedelta(hours=3)
+
+        async def run():
+            async with AsyncGCalClient(credentials=client.credentials) as aclient:
+                event = await aclient.events.create(
+                    test_calendar_id,
+                    summary="Async Test Event",
+                    start=start,
+                    end=start + timedelta(hours=1),
+                )
+                fetched, calendar = await asyncio.gather(
+                    aclient.events.get(test_calendar_id, event.id),
+                    aclient.calendars.get(test_calendar_id),
+                )
+                await aclient.events.delete(test_calendar_id, event.id)
+                return event, fetched, calendar
+
+        event, fetched, calendar = asyncio.run(run())
+        assert fetched.id == event.id
+        assert fetched.summary == "Async Test Event"
+        assert calendar.id == test_calendar_id
+
+    def test_freebusy_queries_concurrently(
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
+    ):
+        """Independent and sharded free/busy queries run through gather."""
+        now, time_max = time_window
+
+        async def run():
+            async with AsyncGCalClient(credentials=client.credentials) as aclient:
+                return await asyncio.gather(
+                    aclient.freebusy.query(["primary"], now, time_max),
+                    aclient.freebusy.query(
+                        ["primary", test_calendar_id],
+                        now,
+                        time_max,
+                        max_calendars_per_request=1,
+                    ),
+                )
+
+        single, sharded = asyncio.run(run())
+        assert "primary" in single.calendars
+        assert {"primary", test_calendar_id} <= set(sharded.calendars)
+
+    def test_list_all_async_split_range(
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
+    ):
+        """Events from every sub-range are returned once, in start order."""
+        now, day_end = time_window
+        created = [
+            client.events.create(
+                test_calendar_id,
+                summary=f"Async List Event {i}",
+                start=now + timedelta(hours=2 * i + 1),
+                end=now + timedelta(hours=2 * i + 3),
+            )
+            for i in range(3)
+        ]
+
+        try:
+            events = asyncio.run(
+                client.events.list_all_async(
+                    test_calendar_id,
+                    time_min=now,
+                    time_max=day_end,
+                    max_workers=4,
+                )
+            )
+            event_ids = [e.id for e in events]
+            assert event_ids == [e.id for e in created]
+        finally:
+            for event in created:
+                client.events.delete(test_calendar_id, event.id)
+
+
+def _mock_transport(handler) -> AsyncTransport:  # noqa: ANN001
+    """An AsyncTransport whose requests are answered by *handler*."""
+    transport = AsyncTransport(Credentials(token="stale-token"))
+    transport._client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return transport
+
+
+class TestAsyncTransport:
+    """Unit tests for AsyncTransport over httpx.MockTransport."""
+
+    def test_concurrent_401s_refresh_once(self):
+        """Requests rejected together wait on a single token refresh."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0)
+            if request.headers["authorization"] != "Bearer fresh-token":
+                return httpx.Response(401)
+            return httpx.Response(200, json={"id": "primary"})
+
+        def refresh(creds: Credentials, request) -> None:  # noqa: ANN001
+            creds.token = "fresh-token"
+
+        async def run():
+            async with _mock_transport(handler) as transport:
+                calendars = AsyncCalendarsResource(transport)
+                return await asyncio.gather(
+                    *(calendars.get("primary") for _ in range(10))
+                )
+
+        with mock.patch.object(
+            Credentials, "refresh", autospec=True, side_effect=refresh
+        ) as patched:
+            results = asyncio.run(run())
+
+        assert patched.call_count == 1
+        assert [c.id for c in results] == ["primary"] * 10
+
+    def test_parse_error_cancels_prefetch(self):
+        """A page that fails to parse leaves no next-page request running."""
+        next_page_sent = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if "pageToken" in request.url.params:
+                next_page_sent.set()
+                await asyncio.Future()  # never answers
+            return httpx.Response(
+                200, json={"items": [{"start": "not a date"}], "nextPageToken": "2"}
+            )
+
+        async def run():
+            async with _mock_transport(handler) as transport:
+                events = AsyncEventsResource(transport)
+                with pytest.raises(ValueError):
+                    await events._fetch_pages("/calendars/primary/events", {})
+                assert next_page_sent.is_set()
+                await asyncio.sleep(0)
+                return asyncio.all_tasks() - {asyncio.current_task()}
+
+        assert asyncio.run(run()) == set()
@@ -0,0 +1,175 @@
+"""Unit tests for credential loading, with token refresh mocked out."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from gcal_sdk import auth
+
+
+def _write_token(path, **overrides) -> dict:
+    token_data = {
+        "token": "old-token",
+        "refresh_token": "refresh-token",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "client-id",
+        "client_secret": "client-secret",
+        "scopes": auth.SCOPES,
+        "expiry": _isoformat(_utcnow() + timedelta(hours=1)),
+        **overrides,
+    }
+    token_data = {k: v for k, v in token_data.items() if v is not None}
+    path.write_text(json.dumps(token_data))
+    return token_data
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, as google-auth stores expiries."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _isoformat(expiry: datetime) -> str:
+    return expiry.isoformat() + "Z"
+
+
+def _fake_refresh(creds: Credentials, request) -> None:
+    creds.token = "new-token"
+    creds.expiry = _utcnow().replace(microsecond=0) + timedelta(hours=1)
+
+
+@pytest.fixture
+def refresh():
+    with mock.patch.object(
+        Credentials, "refresh", autospec=True, side_effect=_fake_refresh
+    ) as refresh:
+        yield refresh
+
+
+@pytest.fixture
+def token_path(tmp_path):
+    return tmp_path / "token.json"
+
+
+@pytest.fixture
+def credentials_path(tmp_path):
+    return tmp_path / "credentials.json"
+
+
+class TestLoadCredentials:
+    """load_credentials only refreshes (and rewrites the file) when needed."""
+
+    def test_fresh_token_is_not_refreshed(self, refresh, token_path, credentials_path):
+        _write_token(token_path)
+        before = token_path.read_bytes()
+
+        creds = auth.load_credentials(credentials_path, token_path)
+
+        assert creds.token == "old-token"
+        assert creds.valid
+        refresh.assert_not_called()
+        assert token_path.read_bytes() == before
+
+    def test_expired_token_is_refreshed_and_saved(
+        self, refresh, token_path, credentials_path
+    ):
+        _write_token(token_path, expiry=_isoformat(_utcnow()))
+
+        creds = auth.load_credentials(credentials_path, token_path)
+
+        refresh.assert_called_once()
+        saved = json.loads(token_path.read_text())
+        assert saved["token"] == creds.token == "new-token"
+        assert auth._parse_expiry(saved["expiry"]) == creds.expiry
+        assert token_path.stat().st_mode & 0o777 == 0o600
+
+    def test_legacy_token_without_expiry(self, refresh, token_path, credentials_path):
+        _write_token(token_path, expiry=None)
+        before = token_path.read_bytes()
+
+        creds = auth.load_credentials(credentials_path, token_path)
+
+        # google-auth treats a token with no expiry as valid
+        assert creds.expiry is None
+        assert creds.valid
+        refresh.assert_not_called()
+        assert token_path.read_bytes() == before
+
+    def test_missing_token_is_refreshed(self, refresh, token_path, credentials_path):
+        _write_token(token_path, token=None, expiry=None)
+
+        creds = auth.load_credentials(credentials_path, token_path)
+
+        refresh.assert_called_once()
+        assert creds.token == "new-token"
+
+    def test_client_info_from_credentials_file(
+        self, refresh, token_path, credentials_path
+    ):
+        _write_token(
+            token_path,
+            client_id=None,
+            client_secret=None,
+            expiry=_isoformat(_utcnow()),
+        )
+        credentials_path.write_text(
+            json.dumps(
+                {"installed": {"client_id": "file-id", "client_secret": "file-secret"}}
+            )
+        )
+
+        creds = auth.load_credentials(credentials_path, token_path)
+
+        refresh.assert_called_once_with(creds, mock.ANY)
+        assert (creds.client_id, creds.client_secret) == ("file-id", "file-secret")
+        saved = json.loads(token_path.read_text())
+        assert saved["client_id"] == "file-id"
+        assert saved["token"] == "new-token"
+
+    def test_missing_token_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            auth.load_credentials(tmp_path / "c.json", tmp_path / "missing.json")
+
+
+class TestSaveToken:
+    def test_unchanged_token_is_not_rewritten(self, refresh, token_path):
+        _write_token(token_path, expiry=_isoformat(_utcnow()))
+        creds = auth.load_credentials(token_path.parent / "c.json", token_path)
+        token_path.unlink()
+
+        auth._save_token(creds, token_path)
+
+        assert not token_path.exists()
+
+    def test_changed_token_is_rewritten(self, refresh, token_path):
+        _write_token(token_path)
+        creds = auth.load_credentials(token_path.parent / "c.json", token_path)
+        creds.token = "rotated-token"
+
+        auth._save_token(creds, token_path)
+
+        assert json.loads(token_path.read_text())["token"] == "rotated-token"
+
+
+class TestParseExpiry:
+    def test_empty(self):
+        assert auth._parse_expiry(None) is None
+        assert auth._parse_expiry("") is None
+
+    def test_zulu_suffix(self):
+        assert auth._parse_expiry("2024-05-01T09:00:00.123456Z") == datetime(
+            2024, 5, 1, 9, 0, 0, 123456
+        )
+
+    def test_offset_is_converted_to_naive_utc(self):
+        expiry = auth._parse_expiry("2024-05-01T11:00:00+02:00")
+
+        assert expiry == datetime(2024, 5, 1, 9, 0)
+        assert expiry.tzinfo is None
+
+    def test_round_trips_saved_format(self):
+        expiry = _utcnow()
+
+        assert auth._parse_expiry(_isoformat(expiry)) == expiry
@@ -0,0 +1,118 @@
+"""Tests for batched requests, against the API and a mocked service."""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from gcal_sdk import Batch, GCalClient
+from gcal_sdk.batch import MAX_BATCH_SIZE
+
+
+class TestBatch:
+    """Tests for queuing calls with client.batch()."""
+
+    def test_batch_get_and_delete(
+        self, client: GCalClient, test_calendar_id: str
+    ):
+        """Fetch and delete several events in one batch."""
+        start = datetime.now(timezone.utc) + timedelta(hours=2)
+        created = [
+            client.events.create(
+                test_calendar_id,
+                summary=f"Batch Test Event {i}",
+                start=start,
+                end=start + timedelta(hours=1),
+            )
+            for i in range(3)
+        ]
+
+        with client.batch() as batch:
+            gets = [batch.events.get(test_calendar_id, e.id) for e in created]
+            deletes = [batch.events.delete(test_calendar_id, e.id) for e in created]
+            missing = batch.events.get(test_calendar_id, "doesnotexist")
+
+        assert [r.result().id for r in gets] == [e.id for e in created]
+        assert all(r.exception() is None for r in deletes)
+        assert missing.exception() is not None
+
+        events = client.events.list(
+            test_calendar_id,
+            time_min=start - timedelta(minutes=1),
+            time_max=start + timedelta(hours=2),
+        )
+        remaining = {e.id for e in events}
+        assert remaining.isdisjoint(e.id for e in created)
+
+    def test_batch_create_and_patch(
+        self, client: GCalClient, test_calendar_id: str
+    ):
+        """Create several events in one batch, then patch them in another."""
+        start = datetime.now(timezone.utc) + timedelta(hours=4)
+
+        with client.batch() as batch:
+            creates = [
+                batch.events.create(
+                    test_calendar_id,
+                    summary=f"Batch Created Event {i}",
+                    start=start,
+                    end=start + timedelta(hours=1),
+                )
+                for i in range(3)
+            ]
+        created = [r.result() for r in creates]
+        assert [e.summary for e in created] == [
+            f"Batch Created Event {i}" for i in range(3)
+        ]
+
+        try:
+            with client.batch() as batch:
+                patches = [
+                    batch.events.patch(test_calendar_id, e.id, location="Batched")
+                    for e in created
+                ]
+            assert all(r.result().location == "Batched" for r in patches)
+        finally:
+            with client.batch() as batch:
+                for event in created:
+                    batch.events.delete(test_calendar_id, event.id)
+
+
+class TestBatchExecute:
+    """Unit tests for Batch.execute with a mocked service (no API calls)."""
+
+    def test_failed_request_resolves_remaining_calls(self):
+        """A failed batch request sets its error on every unsent call."""
+        service = mock.MagicMock()
+        first, second = mock.MagicMock(), mock.MagicMock()
+        second.execute.side_effect = OSError("connection reset")
+        service.new_batch_http_request.side_effect = [first, second]
+
+        batch = Batch(service)
+        handles = [
+            batch.events.get("primary", f"event-{i}")
+            for i in range(MAX_BATCH_SIZE * 2 + 1)
+        ]
+        with pytest.raises(OSError):
+            batch.execute()
+
+        # The first request "succeeded" without invoking callbacks (mocked),
+        # so only calls from the failed request onwards are resolved
+        failed = handles[MAX_BATCH_SIZE:]
+        assert all(h.done for h in failed)
+        assert all(isinstance(h.exception(), OSError) for h in failed)
+        assert not any(h.done for h in handles[:MAX_BATCH_SIZE])
+        assert service.new_batch_http_request.call_count == 2
+
+    def test_sharded_freebusy_query_is_rejected(self):
+        """A free/busy query too large for one request is not run outside the batch."""
+        service = mock.MagicMock()
+        batch = Batch(service)
+        now = datetime.now(timezone.utc)
+
+        with pytest.raises(ValueError):
+            batch.freebusy.query(
+                [f"cal-{i}" for i in range(60)], now, now + timedelta(days=1)
+            )
+        assert len(batch) == 0
+        service.freebusy.return_value.query.return_value.execute.assert_not_called()
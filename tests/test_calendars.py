@@ -40,3 +40,11 @@ class TestCalendars:
         assert cal.id == test_calendar_id
         assert cal.summary is not None
         assert cal.summary.startswith("gcal-sdk-test-")
+
+    def test_iter_all_matches_list_all(
+        self, client: GCalClient, test_calendar_id: str
+    ):
+        """iter_all yields the same calendars as list_all."""
+        iterated = [c.id for c in client.calendars.iter_all()]
+        assert iterated == [c.id for c in client.calendars.list_all()]
+        assert test_calendar_id in iterated
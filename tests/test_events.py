@@ -4,19 +4,23 @@ Tests run against a real temporary test calendar.
 Flow: create -> get -> patch -> list (verify present) -> delete -> list (verify gone)
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 
 from gcal_sdk import GCalClient
+from gcal_sdk.events import _normalize_attendees
 
 
 class TestEventCRUD:
     """Full CRUD lifecycle test for events."""
 
     def test_create_get_update_list_delete(
-        self, client: GCalClient, test_calendar_id: str
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
     ):
         """Test the full event lifecycle: create, get, patch, list, delete."""
-        now = datetime.now(timezone.utc)
+        now, day_end = time_window
         start = now + timedelta(hours=1)
         end = start + timedelta(hours=1)
 
@@ -56,7 +60,7 @@ class TestEventCRUD:
         events = client.events.list(
             test_calendar_id,
             time_min=now,
-            time_max=now + timedelta(days=1),
+            time_max=day_end,
         )
         event_ids = [e.id for e in events]
         assert event_id in event_ids
@@ -68,7 +72,7 @@ class TestEventCRUD:
         events_after = client.events.list(
             test_calendar_id,
             time_min=now,
-            time_max=now + timedelta(days=1),
+            time_max=day_end,
         )
         event_ids_after = [e.id for e in events_after]
         assert event_id not in event_ids_after
@@ -95,3 +99,19 @@ class TestEventCRUD:
 
         # Clean up
         client.events.delete(test_calendar_id, event.id)
+
+
+class TestNormalizeAttendees:
+    """Unit tests for attendee normalization (no API calls)."""
+
+    def test_all_emails(self):
+        assert _normalize_attendees(["a@example.com", "b@example.com"]) == [
+            {"email": "a@example.com"},
+            {"email": "b@example.com"},
+        ]
+
+    def test_mixed_emails_and_dicts(self):
+        attendee = {"email": "b@example.com", "optional": True}
+        result = _normalize_attendees(["a@example.com", attendee])
+        assert result == [{"email": "a@example.com"}, attendee]
+        assert result[1] is attendee
@@ -2,16 +2,17 @@
 
 from datetime import datetime, timedelta, timezone
 
-from gcal_sdk import GCalClient
+from gcal_sdk import BusyPeriod, CalendarFreeBusy, GCalClient
 
 
 class TestFreeBusy:
     """Tests for free/busy queries."""
 
-    def test_query_primary_calendar(self, client: GCalClient):
+    def test_query_primary_calendar(
+        self, client: GCalClient, time_window: tuple[datetime, datetime]
+    ):
         """Query free/busy for the primary calendar over next 24 hours."""
-        now = datetime.now(timezone.utc)
-        time_max = now + timedelta(days=1)
+        now, time_max = time_window
 
         result = client.freebusy.query(
             calendar_ids=["primary"],
@@ -25,11 +26,13 @@ class TestFreeBusy:
         assert isinstance(result.calendars["primary"].busy, list)
 
     def test_query_test_calendar(
-        self, client: GCalClient, test_calendar_id: str
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
     ):
         """Query free/busy for the test calendar."""
-        now = datetime.now(timezone.utc)
-        time_max = now + timedelta(days=1)
+        now, time_max = time_window
 
         result = client.freebusy.query(
             calendar_ids=[test_calendar_id],
@@ -42,17 +45,54 @@ class TestFreeBusy:
         assert isinstance(result.calendars[test_calendar_id].busy, list)
 
     def test_query_multiple_calendars(
-        self, client: GCalClient, test_calendar_id: str
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
     ):
         """Query free/busy for multiple calendars at once."""
-        now = datetime.now(timezone.utc)
-        time_max = now + timedelta(days=1)
+        now, time_max = time_window
+
+        result = client.freebusy.query(
+            calendar_ids=["primary", test_calendar_id],
+            time_min=now,
+            time_max=time_max,
+        )
+
+        assert "primary" in result.calendars
+        assert test_calendar_id in result.calendars
+
+    def test_query_sharded(
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
+    ):
+        """Calendars split across shards are merged into one response."""
+        now, time_max = time_window
 
         result = client.freebusy.query(
             calendar_ids=["primary", test_calendar_id],
             time_min=now,
             time_max=time_max,
+            max_calendars_per_request=1,
         )
 
         assert "primary" in result.calendars
         assert test_calendar_id in result.calendars
+
+
+class TestCalendarFreeBusy:
+    """Unit tests for CalendarFreeBusy helpers (no API calls)."""
+
+    def test_is_busy(self):
+        start = datetime(2024, 5, 1, 9, tzinfo=timezone.utc)
+        info = CalendarFreeBusy(
+            busy=[BusyPeriod(start=start, end=start + timedelta(hours=1))]
+        )
+        assert info.is_busy(start + timedelta(minutes=30), start + timedelta(hours=2))
+        assert info.is_busy(start - timedelta(hours=1), start + timedelta(minutes=1))
+        # Ranges that only touch a busy period are free
+        assert not info.is_busy(start + timedelta(hours=1), start + timedelta(hours=2))
+        assert not info.is_busy(start - timedelta(hours=1), start)
+        assert not CalendarFreeBusy().is_busy(start, start + timedelta(hours=1))
@@ -0,0 +1,29 @@
+"""Unit tests for the request/response JSON model (no API calls)."""
+
+import httplib2
+from googleapiclient.discovery import build
+
+from gcal_sdk._http import FastJsonModel
+
+
+class TestFastJsonModel:
+    """Request bodies must be ASCII so Content-Length matches the bytes sent."""
+
+    def test_non_ascii_body_is_ascii_json(self):
+        body = {"summary": "café 会议 🎉"}
+        service = build(
+            "calendar",
+            "v3",
+            http=httplib2.Http(),
+            model=FastJsonModel(),
+            static_discovery=True,
+        )
+
+        request = service.events().insert(calendarId="primary", body=body)
+
+        # Content-Length is computed as len(body), in characters
+        assert request.body.isascii()
+        assert FastJsonModel().deserialize(request.body.encode()) == body
+
+    def test_deserialize_non_json_returns_text(self):
+        assert FastJsonModel().deserialize(b"not json") == "not json"
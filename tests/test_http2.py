@@ -0,0 +1,119 @@
+"""Unit tests for the HTTP/2 httplib2 stand-in, over a mocked transport."""
+
+import gzip
+import json
+import re
+
+import pytest
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+
+from gcal_sdk import Batch
+from gcal_sdk._http import FastJsonModel, Http2Adapter
+from gcal_sdk.events import EventsResource
+
+httpx = pytest.importorskip("httpx")
+
+_EVENT = {
+    "id": "event-1",
+    "summary": "Mocked",
+    "start": {"dateTime": "2024-05-01T09:00:00Z"},
+    "end": {"dateTime": "2024-05-01T10:00:00Z"},
+}
+
+
+def _json_response(payload: dict, **kwargs) -> "httpx.Response":
+    """A gzip-compressed JSON response, as the API sends with '(gzip)' agents."""
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json", "content-encoding": "gzip"},
+        content=gzip.compress(json.dumps(payload).encode()),
+        **kwargs,
+    )
+
+
+def _batch_response(request: "httpx.Request") -> "httpx.Response":
+    """Answer every part of a multipart batch request with _EVENT."""
+    content_ids = re.findall(rb"Content-ID: <([^>]+)>", request.content)
+    parts = [
+        (
+            "--batch_boundary\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <response-{cid.decode()}>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\n"
+            "Content-Type: application/json\r\n\r\n"
+            f"{json.dumps(_EVENT)}\r\n"
+        )
+        for cid in content_ids
+    ]
+    body = "".join(parts) + "--batch_boundary--\r\n"
+    return httpx.Response(
+        200,
+        headers={"content-type": "multipart/mixed; boundary=batch_boundary"},
+        content=body.encode(),
+    )
+
+
+@pytest.fixture
+def requests_seen() -> list:
+    return []
+
+
+@pytest.fixture
+def adapter(requests_seen: list) -> Http2Adapter:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.url.path == "/batch/calendar/v3":
+            return _batch_response(request)
+        return _json_response({"items": [_EVENT]})
+
+    return Http2Adapter(httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+@pytest.fixture
+def service(adapter: Http2Adapter):
+    http = AuthorizedHttp(Credentials(token="test-token"), http=adapter)
+    return build(
+        "calendar", "v3", http=http, model=FastJsonModel(), static_discovery=True
+    )
+
+
+class TestHttp2Adapter:
+    """Http2Adapter behind AuthorizedHttp and a real googleapiclient Resource."""
+
+    def test_list_call(self, service, requests_seen: list):
+        events = EventsResource(service).list("primary")
+
+        assert [e.id for e in events] == ["event-1"]
+        (request,) = requests_seen
+        assert request.url.path == "/calendar/v3/calendars/primary/events"
+        assert request.headers["authorization"] == "Bearer test-token"
+
+    def test_batch_call(self, service, requests_seen: list):
+        with Batch(service) as batch:
+            first = batch.events.get("primary", "event-1")
+            second = batch.events.get("primary", "event-2")
+
+        assert first.result().id == second.result().id == "event-1"
+        assert len(requests_seen) == 1
+
+    def test_strips_content_encoding(self, adapter: Http2Adapter):
+        response, content = adapter.request("https://example.com/events")
+
+        assert "content-encoding" not in response
+        assert json.loads(content) == {"items": [_EVENT]}
+        assert response.status == 200
+
+    def test_follows_redirects_unless_disabled(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old":
+                return httpx.Response(302, headers={"location": "/new"})
+            return _json_response({"moved": True})
+
+        adapter = Http2Adapter(httpx.Client(transport=httpx.MockTransport(handler)))
+
+        response, _ = adapter.request("https://example.com/old")
+        assert response.status == 200
+        response, _ = adapter.request("https://example.com/old", redirections=0)
+        assert response.status == 302
@@ -0,0 +1,67 @@
+"""Tests for streaming event listing (requires ijson)."""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import httplib2
+import pytest
+import requests
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from gcal_sdk import GCalClient
+from gcal_sdk.events import EventsResource
+
+pytest.importorskip("ijson")
+
+
+class TestIterEvents:
+    """Tests for EventsResource.iter_events against the real API."""
+
+    def test_iter_events_streams_created_event(
+        self,
+        client: GCalClient,
+        test_calendar_id: str,
+        time_window: tuple[datetime, datetime],
+    ):
+        """iter_events yields the same events as list_all."""
+        now, day_end = time_window
+        event = client.events.create(
+            test_calendar_id,
+            summary="Streamed Event",
+            start=now + timedelta(hours=1),
+            end=now + timedelta(hours=2),
+        )
+
+        try:
+            window = {"time_min": now, "time_max": day_end}
+            streamed = list(client.events.iter_events(test_calendar_id, **window))
+            listed = client.events.list_all(test_calendar_id, **window)
+            assert [e.id for e in streamed] == [e.id for e in listed]
+            assert event.id in {e.id for e in streamed}
+        finally:
+            client.events.delete(test_calendar_id, event.id)
+
+
+class TestIterEventsErrors:
+    """Unit tests for iter_events error handling (no API calls)."""
+
+    def test_error_status_raises_http_error(self):
+        service = build("calendar", "v3", http=httplib2.Http(), static_discovery=True)
+        events = EventsResource(service, credentials=Credentials(token="token"))
+        response = requests.Response()
+        response.status_code = 404
+        response.headers["Content-Type"] = "application/json"
+        response._content = b'{"error": {"code": 404, "message": "Not Found"}}'
+
+        with mock.patch(
+            "google.auth.transport.requests.AuthorizedSession.get",
+            return_value=response,
+        ):
+            with pytest.raises(HttpError) as excinfo:
+                next(events.iter_events("missing"))
+
+        assert excinfo.value.status_code == 404
+        assert excinfo.value.reason == "Not Found"
+        assert "/calendars/missing/events" in excinfo.value.uri